@@ -1,33 +1,108 @@
 #!/usr/bin/env python3
 
 import asyncio
+import importlib.util
 import json
+import sys
+import time
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, TypedDict
 
-# Try to import MCP dependencies, fall back to standalone mode if not available
+# Prefer orjson for response encoding, fall back to the stdlib json module
 try:
-    from mcp.server.models import InitializationOptions
-    from mcp.server import NotificationOptions, Server
-    from mcp.types import (
-        Resource,
-        Tool,
-        TextContent,
-        ImageContent,
-        EmbeddedResource,
-        LoggingLevel
-    )
-    import mcp.types as types
-    MCP_AVAILABLE = True
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON bytes using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to indented JSON bytes using the stdlib json module."""
+        # Non-ASCII characters are escaped, so the output is plain ASCII bytes
+        return json.dumps(obj, indent=2).encode("ascii")
+
+if TYPE_CHECKING:
+    from mcp.server import Server
+
+# Only check whether MCP is installed here; its modules are imported lazily in
+# _setup_mcp() so the standalone demo does not pay for mcp's import tree. If the
+# install turns out to be broken, main() still falls back to standalone mode.
+MCP_AVAILABLE = importlib.util.find_spec("mcp") is not None
+if not MCP_AVAILABLE:
     print("MCP library not found. Running in standalone mode.")
     print("To use as MCP server, install with: pip install mcp")
-    MCP_AVAILABLE = False
 
-if MCP_AVAILABLE:
+
+# Upper bound on the number of queries accepted by check_seat_availability_batch
+_MAX_BATCH_QUERIES = 50
+
+
+def _setup_mcp() -> "Server":
+    """
+    Import the MCP library and create the server with its tool handlers.
+    """
+    from mcp.server import Server
+    from mcp.types import Tool
+    import mcp.types as types
+    
     # Create the server instance
     server = Server("railway-reservation-system")
 
+    # Input schema for a single availability query, shared by the single and batch tools
+    query_schema = {
+        "type": "object",
+        "properties": {
+            "train_name": {
+                "type": "string",
+                "description": "Name of the train (e.g., 'Rajdhani Express', 'Shatabdi Express')"
+            },
+            "travel_date": {
+                "type": "string",
+                "description": "Date of travel in YYYY-MM-DD format"
+            },
+            "start_station": {
+                "type": "string", 
+                "description": "Starting station name or code (e.g., 'New Delhi', 'NDLS')"
+            },
+            "end_station": {
+                "type": "string",
+                "description": "Destination station name or code (e.g., 'Mumbai Central', 'BCT')"
+            },
+            "travel_class": {
+                "type": "string",
+                "description": "Class of travel (AC1, AC2, AC3, Sleeper, CC, EC, etc.)",
+                "enum": ["AC1", "AC2", "AC3", "Sleeper", "CC", "EC", "2S"]
+            }
+        },
+        "required": ["train_name", "travel_date", "start_station", "end_station", "travel_class"]
+    }
+
+    # The tool list never changes, so build it once instead of on every list_tools call
+    tools = [
+        Tool(
+            name="check_seat_availability",
+            description="Check seat availability for railway reservations. Returns availability for different berth types (upper, middle, lower) along with pricing and booking status.",
+            inputSchema=query_schema
+        ),
+        Tool(
+            name="check_seat_availability_batch",
+            description="Check seat availability for several trains, routes or classes at once. Returns one result per query, in the same order.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "description": "Availability queries, each with the same fields as check_seat_availability",
+                        "items": query_schema,
+                        "minItems": 1,
+                        "maxItems": _MAX_BATCH_QUERIES
+                    }
+                },
+                "required": ["queries"]
+            }
+        )
+    ]
 
     @server.list_tools()
     async def handle_list_tools() -> List[Tool]:
@@ -35,40 +110,19 @@ if MCP_AVAILABLE:
         List available tools.
         Each tool should have a name, description, and parameters.
         """
-        return [
-            Tool(
-                name="check_seat_availability",
-                description="Check seat availability for railway reservations. Returns availability for different berth types (upper, middle, lower) along with pricing and booking status.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "train_name": {
-                            "type": "string",
-                            "description": "Name of the train (e.g., 'Rajdhani Express', 'Shatabdi Express')"
-                        },
-                        "travel_date": {
-                            "type": "string",
-                            "description": "Date of travel in YYYY-MM-DD format"
-                        },
-                        "start_station": {
-                            "type": "string", 
-                            "description": "Starting station name or code (e.g., 'New Delhi', 'NDLS')"
-                        },
-                        "end_station": {
-                            "type": "string",
-                            "description": "Destination station name or code (e.g., 'Mumbai Central', 'BCT')"
-                        },
-                        "travel_class": {
-                            "type": "string",
-                            "description": "Class of travel (AC1, AC2, AC3, Sleeper, CC, EC, etc.)",
-                            "enum": ["AC1", "AC2", "AC3", "Sleeper", "CC", "EC", "2S"]
-                        }
-                    },
-                    "required": ["train_name", "travel_date", "start_station", "end_station", "travel_class"]
-                }
-            )
-        ]
+        return tools
 
+    def _lookup_availability(query: dict) -> str:
+        """
+        Render the availability payload for a single query.
+        """
+        return _render_availability(
+            train_name=query["train_name"],
+            travel_date=query["travel_date"], 
+            start_station=query["start_station"],
+            end_station=query["end_station"],
+            travel_class=sys.intern(query["travel_class"])
+        )
 
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent]:
@@ -76,47 +130,182 @@ if MCP_AVAILABLE:
         Handle tool calls from the client.
         """
         if name == "check_seat_availability":
-            result = await check_seat_availability(
-                train_name=arguments["train_name"],
-                travel_date=arguments["travel_date"], 
-                start_station=arguments["start_station"],
-                end_station=arguments["end_station"],
-                travel_class=arguments["travel_class"]
-            )
-            
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            payloads = [_lookup_availability(arguments)]
+        elif name == "check_seat_availability_batch":
+            payloads = [_lookup_availability(query) for query in arguments["queries"]]
         else:
             raise ValueError(f"Unknown tool: {name}")
+        
+        # The payloads are already-rendered JSON text, so skip pydantic field
+        # validation; the SDK serializes the envelope from these instances
+        return [
+            types.TextContent.model_construct(
+                type="text",
+                text=payload
+            )
+            for payload in payloads
+        ]
+    
+    return server
+
+
+# Shape of the availability response. These are TypedDicts rather than
+# classes so responses stay plain dicts that orjson serializes natively.
+class Route(TypedDict):
+    start_station: str
+    end_station: str
+    departure_time: str
+    arrival_time: str
+    duration: str
+
+
+class TrainDetails(TypedDict):
+    train_name: str
+    train_number: str
+    travel_date: str
+    route: Route
+
+
+class BerthInfo(TypedDict):
+    total: int
+    available: int
+    price: float
+
+
+class ClassAvailability(TypedDict):
+    total_seats: int
+    available_seats: int
+    waiting_list: int
+    berth_availability: Dict[str, BerthInfo]
+    status: str
+    base_fare: float
+    booking_status: str
+
+
+class AdditionalInfo(TypedDict):
+    tatkal_available: bool
+    premium_tatkal_available: bool
+    cancellation_charges: Dict[str, str]
+    booking_counter: str
+    last_updated: str
+
+
+# "class" is a keyword, so this one needs the functional syntax
+AlternateOption = TypedDict("AlternateOption", {
+    "train_name": str,
+    "train_number": str,
+    "departure_time": str,
+    "available_seats": int,
+    "class": str
+})
+
+
+class AvailabilityResponse(TypedDict):
+    train_details: TrainDetails
+    class_availability: Dict[str, ClassAvailability]
+    additional_info: AdditionalInfo
+    alternate_options: List[AlternateOption]
+
+
+# Sample availability data - in real implementation, this would query a database.
+# Sub-trees that do not depend on the request are built once at import time and
+# shared by every response; they are read-only since responses are serialized
+# immediately after construction.
+_BASE_FARE = 1200.0
+
+# Premium added to the base fare for each berth type
+_BERTH_PREMIUMS = {
+    "upper": 50.0,
+    "middle": 75.0,
+    "lower": 100.0
+}
+
+
+def _compute_fares(base_fare: float, premiums: Dict[str, float]) -> Dict[str, float]:
+    """
+    Compute the price of each berth type from the base fare and its premium.
+    """
+    return {berth: base_fare + premium for berth, premium in premiums.items()}
+
+
+# Fares are fixed for the sample data, so they are computed once up front
+_BERTH_FARES = _compute_fares(_BASE_FARE, _BERTH_PREMIUMS)
+
+# Every berth type has the same number of berths; only availability and price vary
+_BERTH_BASE = {"total": 24}
+
+_BERTHS_AVAILABLE = {
+    "upper": 6,
+    "middle": 4,
+    "lower": 8
+}
+
+_BERTH_AVAILABILITY: Dict[str, BerthInfo] = {
+    berth: {**_BERTH_BASE, "available": available, "price": _BERTH_FARES[berth]}
+    for berth, available in _BERTHS_AVAILABLE.items()
+}
+
+_CLASS_AVAILABILITY: ClassAvailability = {
+    "total_seats": 72,
+    "available_seats": 18,
+    "waiting_list": 5,
+    "berth_availability": _BERTH_AVAILABILITY,
+    "status": "Available" if 18 > 0 else "Waiting List",
+    "base_fare": _BASE_FARE,
+    "booking_status": "OPEN"
+}
+
+_CANCELLATION_CHARGES = {
+    "upto_4_hours": "25% of fare",
+    "4_to_12_hours": "50% of fare",
+    "after_12_hours": "No refund"
+}
+
+_ALTERNATES_TEMPLATE = (
+    {
+        "train_name": "Shatabdi Express",
+        "train_number": "12002",
+        "departure_time": "10:15",
+        "available_seats": 32
+    },
+    {
+        "train_name": "Mail Express",
+        "train_number": "12003",
+        "departure_time": "16:30",
+        "available_seats": 45
+    }
+)
+
+# [epoch second, formatted timestamp] for the most recent _now_str() call
+_ts_cache = [0, ""]
+
+
+def _now_str() -> str:
+    """
+    Return the current local time as "YYYY-MM-DD HH:MM:SS".
+    
+    The formatted string only changes once per second, so it is memoized on
+    the integer epoch second instead of calling strftime on every request.
+    """
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+    return _ts_cache[1]
 
 
-async def check_seat_availability(
+def _build_availability(
     train_name: str,
     travel_date: str,
     start_station: str,
     end_station: str,
-    travel_class: str
-) -> Dict[str, Any]:
+    travel_class: str,
+    last_updated: str
+) -> AvailabilityResponse:
     """
-    Check seat availability for a given train and route.
-    
-    Args:
-        train_name (str): Name of the train (e.g., "Rajdhani Express")
-        travel_date (str): Date of travel in YYYY-MM-DD format
-        start_station (str): Starting station code/name
-        end_station (str): Destination station code/name
-        travel_class (str): Class of travel (AC1, AC2, AC3, Sleeper, etc.)
-    
-    Returns:
-        Dict[str, Any]: JSON response with availability details
+    Assemble the availability response dict from its per-request fields.
     """
-    
-    # Sample availability data - in real implementation, this would query a database
-    availability_data = {
+    return {
         "train_details": {
             "train_name": train_name,
             "train_number": "12001",  # Sample train number
@@ -130,60 +319,148 @@ async def check_seat_availability(
             }
         },
         "class_availability": {
-            travel_class: {
-                "total_seats": 72,
-                "available_seats": 18,
-                "waiting_list": 5,
-                "berth_availability": {
-                    "upper": {
-                        "total": 24,
-                        "available": 6,
-                        "price": 1250.0
-                    },
-                    "middle": {
-                        "total": 24,
-                        "available": 4,
-                        "price": 1275.0
-                    },
-                    "lower": {
-                        "total": 24,
-                        "available": 8,
-                        "price": 1300.0
-                    }
-                },
-                "status": "Available" if 18 > 0 else "Waiting List",
-                "base_fare": 1200.0,
-                "booking_status": "OPEN"
-            }
+            travel_class: _CLASS_AVAILABILITY
         },
         "additional_info": {
             "tatkal_available": True,
             "premium_tatkal_available": False,
-            "cancellation_charges": {
-                "upto_4_hours": "25% of fare",
-                "4_to_12_hours": "50% of fare",
-                "after_12_hours": "No refund"
-            },
+            "cancellation_charges": _CANCELLATION_CHARGES,
             "booking_counter": "IRCTC Online",
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "last_updated": last_updated
         },
         "alternate_options": [
-            {
-                "train_name": "Shatabdi Express",
-                "train_number": "12002",
-                "departure_time": "10:15",
-                "available_seats": 32,
-                "class": travel_class
-            },
-            {
-                "train_name": "Mail Express",
-                "train_number": "12003", 
-                "departure_time": "16:30",
-                "available_seats": 45,
-                "class": travel_class
-            }
+            {**alternate, "class": travel_class}
+            for alternate in _ALTERNATES_TEMPLATE
         ]
     }
+
+
+# The response schema is fixed, so serialize it once with placeholder strings
+# and turn it into a bytes %-format template. Rendering then only encodes the
+# per-request values instead of building and walking the whole dict, and stays
+# in UTF-8 bytes until the final decode for TextContent. The advertised travel
+# classes use the per-class templates below, which already contain the class,
+# so five values are encoded; unknown classes encode all six. Everything else
+# in the payload (route timings, berth and class blocks, additional_info and
+# alternate_options) is pre-serialized here. The bytes % operator splices the
+# values in C, which measured faster than joining pre-split fragment lists.
+_TEMPLATE_FIELDS = (
+    "train_name",
+    "travel_date",
+    "start_station",
+    "end_station",
+    "travel_class",
+    "last_updated"
+)
+
+
+def _build_response_template() -> bytes:
+    template = _dumps(
+        _build_availability(*(f"@@{field}@@" for field in _TEMPLATE_FIELDS))
+    )
+    template = template.replace(b"%", b"%%")
+    for field in _TEMPLATE_FIELDS:
+        template = template.replace(f'"@@{field}@@"'.encode(), f"%({field})b".encode())
+    return template
+
+
+_RESPONSE_TEMPLATE = _build_response_template()
+
+# Travel classes advertised in the tool schema, interned so lookups on the
+# request path compare by identity. Each class gets its own template with the
+# class already filled in, selected by the class's index.
+_TRAVEL_CLASSES = ("AC1", "AC2", "AC3", "Sleeper", "CC", "EC", "2S")
+_CLASS_INDEX = {sys.intern(c): i for i, c in enumerate(_TRAVEL_CLASSES)}
+_CLASS_TEMPLATES = tuple(
+    _RESPONSE_TEMPLATE.replace(b"%(travel_class)b", _dumps(c))
+    for c in _TRAVEL_CLASSES
+)
+
+
+@lru_cache(maxsize=1024)
+def _render_payload(
+    train_name: str,
+    travel_date: str,
+    start_station: str,
+    end_station: str,
+    travel_class: str,
+    last_updated: str
+) -> str:
+    """
+    Fill the response template, memoized on the full set of inputs.
+    
+    last_updated is part of the key, so a cached payload is only reused
+    within the same second and entries from earlier seconds age out.
+    """
+    fields = {
+        b"train_name": _dumps(train_name),
+        b"travel_date": _dumps(travel_date),
+        b"start_station": _dumps(start_station),
+        b"end_station": _dumps(end_station),
+        b"last_updated": _dumps(last_updated)
+    }
+    index = _CLASS_INDEX.get(travel_class)
+    if index is not None:
+        return (_CLASS_TEMPLATES[index] % fields).decode("utf-8")
+    
+    # Classes outside the advertised set fall back to the generic template
+    fields[b"travel_class"] = _dumps(travel_class)
+    return (_RESPONSE_TEMPLATE % fields).decode("utf-8")
+
+
+def _render_availability(
+    train_name: str,
+    travel_date: str,
+    start_station: str,
+    end_station: str,
+    travel_class: str
+) -> str:
+    """
+    Render the availability response straight to a JSON string.
+    
+    Produces the same document as serializing check_seat_availability()'s
+    result, without building the intermediate dict. Repeated queries within
+    the same second are served from a cache.
+    """
+    return _render_payload(
+        train_name,
+        travel_date,
+        start_station,
+        end_station,
+        travel_class,
+        _now_str()
+    )
+
+
+def check_seat_availability(
+    train_name: str,
+    travel_date: str,
+    start_station: str,
+    end_station: str,
+    travel_class: str
+) -> AvailabilityResponse:
+    """
+    Check seat availability for a given train and route.
+    
+    Args:
+        train_name (str): Name of the train (e.g., "Rajdhani Express")
+        travel_date (str): Date of travel in YYYY-MM-DD format
+        start_station (str): Starting station code/name
+        end_station (str): Destination station code/name
+        travel_class (str): Class of travel (AC1, AC2, AC3, Sleeper, etc.)
+    
+    Returns:
+        AvailabilityResponse: JSON response with availability details
+    """
+    
+    availability_data = _build_availability(
+        train_name,
+        travel_date,
+        start_station,
+        end_station,
+        travel_class,
+        _now_str()
+    )
     
     return availability_data
 
@@ -192,10 +469,24 @@ async def main():
     """
     Main function to run the MCP server or standalone demo.
     """
+    server = None
     if MCP_AVAILABLE:
+        try:
+            from mcp.server.models import InitializationOptions
+            from mcp.server import NotificationOptions
+            from mcp.server.stdio import stdio_server
+            
+            server = _setup_mcp()
+        except ImportError:
+            print("MCP library could not be imported. Running in standalone mode.")
+            print("To use as MCP server, reinstall with: pip install mcp")
+    
+    if server is not None:
         # Run as MCP server
-        from mcp.server.stdio import stdio_server
-        
+        # The SDK's stdio transport frames and parses messages itself, and
+        # server.run() dispatches each request as its own task, so pending
+        # requests already run concurrently; clients wanting several lookups
+        # in one round trip use check_seat_availability_batch.
         async with stdio_server() as (read_stream, write_stream):
             await server.run(
                 read_stream,
@@ -229,7 +520,7 @@ async def main():
         print("-" * 50)
         
         # Get availability data
-        availability = await check_seat_availability(
+        availability = check_seat_availability(
             train_name=train_name,
             travel_date=travel_date,
             start_station=start_station,
@@ -237,9 +528,18 @@ async def main():
             travel_class=travel_class
         )
         
-        # Print formatted JSON response
-        print(json.dumps(availability, indent=2, ensure_ascii=False))
+        # Write formatted JSON response straight to the binary stdout buffer
+        payload_bytes = _dumps(availability)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload_bytes + b"\n")
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use the libuv-based event loop when available (not supported on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())